@@ -4,45 +4,70 @@ Contains argument parser configuration for the command-line interface
 """
 
 import argparse
-from typing import Callable, Dict
+from functools import cache
+from typing import Callable, Dict, Optional, Sequence
 from .__version__ import __version__
 
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Subparsers action that only adds a command's arguments once that command is parsed"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._deferred_setups: Dict[str, Callable[[argparse.ArgumentParser], None]] = {}
+
+    def add_lazy_parser(self, name: str, setup: Callable[[argparse.ArgumentParser], None], **kwargs) -> argparse.ArgumentParser:
+        """Register a command whose arguments are added by setup on first use"""
+        command_parser = self.add_parser(name, **kwargs)
+        self._deferred_setups[name] = setup
+        return command_parser
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # Build the selected command's arguments before handing off to it
+        command = values[0]
+        setup = self._deferred_setups.pop(command, None)
+        if setup is not None:
+            setup(self._name_parser_map[command])
+        super().__call__(parser, namespace, values, option_string)
+
+@cache
 def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser for Canvas CLI"""
+    """
+    Create the main argument parser for Canvas CLI
+    
+    The parser is built once and shared by every caller, so only parse with it
+    (parse_args/print_help) and never add arguments to the returned instance.
+    """
     
     # Create the main parser
     parser = argparse.ArgumentParser(description="Canvas CLI tool")
     # Add version argument
     parser.add_argument('--version', action='version', version=f'canvas-cli (canvas-cmd) version {__version__}', help='Show version information')
-    # Subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    # Subparsers for different commands, each only built when invoked
+    subparsers = parser.add_subparsers(dest="command", help="Command to run", action=_LazySubParsersAction)
     subparsers.required = True
 
-    # Config command
-    setup_config_parser(subparsers)
+    # Config command (matches git config style)
+    subparsers.add_lazy_parser("config", setup_config_parser, help="Configure Canvas API settings")
     
     # Init command
-    setup_init_parser(subparsers)
+    subparsers.add_lazy_parser("init", setup_init_parser, help="Initialize a Canvas project in the current directory")
     
-      # Push command
-    setup_push_parser(subparsers)
+    # Push command
+    subparsers.add_lazy_parser("push", setup_push_parser, help="Submit an assignment to Canvas")
     
     # Status command
-    setup_status_parser(subparsers)
+    subparsers.add_lazy_parser("status", setup_status_parser, help="Get status about an assignment or class")
 
     # Pull command
-    setup_pull_parser(subparsers)
+    subparsers.add_lazy_parser("pull", setup_pull_parser, help="Download assignment details from Canvas")
     
     # Clone command
-    setup_clone_parser(subparsers)
+    subparsers.add_lazy_parser("clone", setup_clone_parser, help="Download assignment details from Canvas")
 
     return parser
 
-def setup_config_parser(subparsers) -> None:
+def setup_config_parser(config_parser: argparse.ArgumentParser) -> None:
     """Set up the config command parser"""
-    # Config command parser (matches git config style)
-    config_parser = subparsers.add_parser("config", help="Configure Canvas API settings")
-    
     # Helper function to accept --global or --local as mutually exclusive options
     def add_file_options_group(parser):
         group = parser.add_mutually_exclusive_group()
@@ -117,9 +142,8 @@ def setup_config_parser(subparsers) -> None:
     # config_parser.add_argument('name', nargs='?', help="Setting key")
     # config_parser.add_argument('value', nargs='?', help="Value to set for the key")
 
-def setup_init_parser(subparsers) -> None:
+def setup_init_parser(init_parser: argparse.ArgumentParser) -> None:
     """Set up the init command parser"""
-    init_parser = subparsers.add_parser("init", help="Initialize a Canvas project in the current directory")
     init_parser.add_argument("-cid", "--course_id", help="Course ID")
     init_parser.add_argument("-aid", "--assignment_id", help="Assignment ID")
     init_parser.add_argument("-cn", "--course_name", help="Course name")
@@ -128,16 +152,14 @@ def setup_init_parser(subparsers) -> None:
     init_parser.add_argument("-t", "--tui", help="Select values from a User Interface", action="store_true")
     init_parser.add_argument("--fallback", dest="fallback_tui", help="Use fallback tui", action="store_true")
 
-def setup_push_parser(subparsers) -> None:
+def setup_push_parser(push_parser: argparse.ArgumentParser) -> None:
     """Set up the push command parser"""
-    push_parser = subparsers.add_parser("push", help="Submit an assignment to Canvas")
     push_parser.add_argument("-cid", "--course_id", metavar="id", type=int, help="Course ID")
     push_parser.add_argument("-aid", "--assignment_id", metavar="id", type=int, help="Assignment ID")
     push_parser.add_argument("-f", "--file", metavar="file", type=str, help="Path to the file to submit (optional if set during init)")
 
-def setup_status_parser(subparsers) -> None:
+def setup_status_parser(status_parser: argparse.ArgumentParser) -> None:
     """Set up the status command parser"""
-    status_parser = subparsers.add_parser("status", help="Get status about an assignment or class")
     status_parser.add_argument("-cid", "--course_id", metavar="id", type=int, help="Course ID")
     status_parser.add_argument("-aid", "--assignment_id", metavar="id", type=int, help="Assignment ID")
     
@@ -153,9 +175,8 @@ def setup_status_parser(subparsers) -> None:
     global_parser = subparser.add_parser("all", help="Show grades from all classes")
     global_parser.add_argument("-m", "--messages", dest="messages", action="store_true", help="Show messages for global view")
 
-def setup_pull_parser(subparsers) -> None:
-    pull_parser = subparsers.add_parser("pull", help="Download assignment details from Canvas")    
-    
+def setup_pull_parser(pull_parser: argparse.ArgumentParser) -> None:
+    """Set up the pull command parser"""
     identify_group = pull_parser.add_argument_group("Course and Assignment Identification")
     identify_group.add_argument( "-cid", "--course_id", dest="course_id", metavar="COURSE_ID", type=int, help="Canvas Course ID (integer)." )
     identify_group.add_argument( "-aid", "--assignment_id", dest="assignment_id", metavar="ASSIGNMENT_ID", type=int, help="Canvas Assignment ID (integer)." )
@@ -170,9 +191,8 @@ def setup_pull_parser(subparsers) -> None:
     download_group.add_argument("-dl", "--download-latest", dest="download_latest", action="store_true", help="Download the latest assignment submission")
     identify_group.add_argument("-dt", "--download-tui", dest="download_tui", action="store_true", help="Use interactive Text-based User Interface to select download.")
 
-def setup_clone_parser(subparsers):
-    clone_parser = subparsers.add_parser("clone", help="Download assignment details from Canvas")
-    
+def setup_clone_parser(clone_parser: argparse.ArgumentParser) -> None:
+    """Set up the clone command parser"""
     identify_group = clone_parser.add_argument_group("Course and Assignment Identification")
     identify_group.add_argument( "-cid", "--course_id", dest="course_id", metavar="COURSE_ID", type=int, help="Canvas Course ID (integer)." )
     identify_group.add_argument( "-aid", "--assignment_id", dest="assignment_id", metavar="ASSIGNMENT_ID", type=int, help="Canvas Assignment ID (integer)." )
@@ -209,19 +229,20 @@ def setup_clone_parser(subparsers):
 #     download_group.add_argument("-ds", "--download-submissions", dest="download_submissions", action="store_true", help="NI - Download all submissions")
     download_group.add_argument("-dd", "--delete-temp", dest="delete_after_convert", action="store_true", help="NI - Delete temporary files after processing")
 
-def parse_args_and_dispatch(command_handlers: Dict[str, Callable]) -> None:
+def parse_args_and_dispatch(command_handlers: Dict[str, Callable], argv: Optional[Sequence[str]] = None) -> None:
     """
     Parse command line arguments and dispatch to the appropriate handler
     
     Args:
         command_handlers: Dictionary mapping command names to handler functions
+        argv: Arguments to parse instead of sys.argv[1:]
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Get the appropriate handler for the command
-    command = args.command
-    if command in command_handlers:
-        command_handlers[command](args)
+    handler = command_handlers.get(args.command)
+    if handler is not None:
+        handler(args)
     else:
         parser.print_help()
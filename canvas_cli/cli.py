@@ -369,8 +369,8 @@ def help_command(args):
         print("  status  - Get status information about assignments and courses")
         print("  help    - Show help information")
 
-def main():
-    """Main CLI entry point"""
+def main(argv=None):
+    """Main CLI entry point, parsing argv instead of sys.argv[1:] when given"""
     # Define command handlers
     command_handlers = {
         "config": config_command,
@@ -383,7 +383,7 @@ def main():
     }
     
     # Parse arguments and dispatch to the appropriate handler
-    parse_args_and_dispatch(command_handlers)
+    parse_args_and_dispatch(command_handlers, argv)
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
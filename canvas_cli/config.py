@@ -4,12 +4,45 @@ Handles loading, saving, and managing configuration settings for the Canvas CLI.
 """
 
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Literal
 
 # Global config path
 USER_CONFIG_PATH = Path.home() / ".canvascli" / "config.json"
 
+def _write_json(path: Path, json_data: dict, default_mode: int | None = None) -> None:
+    """Write JSON to a temporary file beside the target then atomically replace it
+
+    The existing file's permissions are kept. A new file gets default_mode, or the
+    mode open() would give it under the current umask.
+    """
+    # Follow symlinks so the real file is updated rather than the link replaced
+    path = path.resolve()
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        if default_mode is None:
+            umask = os.umask(0)
+            os.umask(umask)
+            default_mode = 0o666 & ~umask
+        mode = default_mode
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(json_data, indent=4))
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
 class Config:
     """Configuration class for Canvas CLI"""
     
@@ -26,8 +59,8 @@ class Config:
     def save_global(json_data: dict) -> None:
         """Save global API configuration"""
         USER_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(USER_CONFIG_PATH, "w") as f:
-            json.dump(json_data, f, indent=4)
+        # The global config holds the API token, so keep it private to the user
+        _write_json(USER_CONFIG_PATH, json_data, default_mode=0o600)
 
     @staticmethod
     def set_value(key: str, value: str, scope: Literal["global", "local"]) -> None:
@@ -125,5 +158,4 @@ class Config:
         if config_dir:
             config["file_path"] = str(config_dir)
             
-        with open(config_dir / "canvas.json", "w") as f:
-            json.dump(config, f, indent=4)
+        _write_json(config_dir / "canvas.json", config)
@@ -25,7 +25,7 @@ def sanitize_data(data, url=None):
             data["email"] = f"user{data['id']}@example.com"
         
         # Process each item in the dictionary
-        for key, value in list(data.items()):
+        for key, value in data.items():
             if key in ["access_token", "api_key", "password", "token", "secure_params", "uuid", "url"]:
                 data[key] = "REDACTED"
             elif isinstance(value, str):
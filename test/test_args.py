@@ -2,188 +2,245 @@
 Tests for the args module
 """
 
-import sys
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock
 
 from test_base import CanvasCliTestCase
 from canvas_cli.args import create_parser, parse_args_and_dispatch
 
+# Command lines used by the parser tests (without the program name)
+CONFIG_LIST_ARGV = ('config', 'list', '--global')
+CONFIG_GET_ARGV = ('config', 'get', 'token', '--global')
+CONFIG_SET_ARGV = ('config', 'set', 'host', 'canvas.example.com', '--global')
+INIT_ALL_ARGV = (
+    'init',
+    '-cid', '12345',
+    '-aid', '67890',
+    '-cn', 'Test Course',
+    '-an', 'Test Assignment',
+    '-f', 'test.py',
+    '-t'
+)
+PUSH_ALL_ARGV = (
+    'push',
+    '-cid', '12345',
+    '-aid', '67890',
+    '-f', 'test.py'
+)
+STATUS_BASIC_ARGV = (
+    'status',
+    '-cid', '12345',
+    '-aid', '67890'
+)
+STATUS_GLOBAL_ARGV = ('status', 'all')
+DISPATCH_ARGVS = (
+    ('config', 'list'),
+    ('init',),
+    ('push',),
+    ('status',)
+)
+PULL_BASIC_ARGV = (
+    'pull',
+    '-cid', '12345',
+    '-aid', '67890'
+)
+PULL_ALL_ARGV = (
+    'pull',
+    '-cid', '12345',
+    '-aid', '67890',
+    '-t',
+    '--fallback',
+    '-od', './downloads',
+    '-f',
+    '-dl',
+    '-dt'
+)
+PULL_DEFAULTS_ARGV = ('pull',)
+
+# (argv, expected attributes) table for the pull parser
+PULL_PARSER_CASES = (
+    (PULL_BASIC_ARGV, {
+        'command': 'pull',
+        'course_id': 12345,
+        'assignment_id': 67890,
+        'output_directory': '.',
+        'overwrite_file': False,
+        'download_latest': False,
+    }),
+    (PULL_ALL_ARGV, {
+        'command': 'pull',
+        'course_id': 12345,
+        'assignment_id': 67890,
+        'tui': True,
+        'fallback_tui': True,
+        'output_directory': './downloads',
+        'overwrite_file': True,
+        'download_latest': True,
+        'download_tui': True,
+    }),
+)
+
+# Expected attributes when pull is given no options
+PULL_DEFAULTS = {
+    'command': 'pull',
+    'course_id': None,
+    'assignment_id': None,
+    'tui': False,
+    'fallback_tui': False,
+    'output_directory': '.',
+    'overwrite_file': False,
+    'download_latest': False,
+    'download_tui': False,
+}
+
 class ArgsTests(CanvasCliTestCase):
     """Tests for the args module"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the parser once; parse_args does not mutate it"""
+        super().setUpClass()
+        cls.parser = create_parser()
+        cls.pull_defaults = cls.parser.parse_args(PULL_DEFAULTS_ARGV)
+    
+    def test_create_parser_cached(self):
+        """Test that the parser is built once and shared"""
+        self.assertIs(create_parser(), self.parser)
+    
     def test_create_parser(self):
         """Test creating the argument parser"""
-        # Create parser
-        parser = create_parser()
+        # Use the shared parser
+        parser = self.parser
         
         # Verify it contains the expected commands
-        subparsers = [action for action in parser._actions 
-                     if action.dest == 'command'][0]
+        subparsers = next(action for action in parser._actions
+                          if action.dest == 'command')
         choices = subparsers.choices
         
         # Check for required commands
         self.assertIn('config', choices)
         self.assertIn('init', choices)
         self.assertIn('push', choices)
-        # self.assertIn('pull', choices)
+        self.assertIn('pull', choices)
         self.assertIn('status', choices)
     
+    def test_subparsers_built_lazily(self):
+        """Test that command arguments are only added once the command is parsed"""
+        # Bypass the cache so no command has been parsed yet
+        parser = create_parser.__wrapped__()
+        subparsers = next(a for a in parser._actions if a.dest == 'command')
+        
+        # No command has its arguments yet
+        self.assertEqual(subparsers.choices['pull']._actions[1:], [])
+        
+        # Parsing a command builds only that command
+        args = parser.parse_args(['pull', '-cid', '12345'])
+        self.assertEqual(args.course_id, 12345)
+        self.assertNotEqual(subparsers.choices['pull']._actions[1:], [])
+        self.assertEqual(subparsers.choices['status']._actions[1:], [])
+    
     def test_config_parser(self):
         """Test the config command parser"""
-        # Create parser
-        parser = create_parser()
+        # Use the shared parser
+        parser = self.parser
         
         # Test with list subcommand
-        with patch('sys.argv', ['canvas', 'config', 'list', '--global']):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'config')
-            self.assertEqual(args.config_command, 'list')
-            self.assertEqual(args.scope, 'global')
+        args = parser.parse_args(CONFIG_LIST_ARGV)
+        self.assertEqual(args.command, 'config')
+        self.assertEqual(args.config_command, 'list')
+        self.assertEqual(args.scope, 'global')
         
         # Test with get subcommand
-        with patch('sys.argv', ['canvas', 'config', 'get', 'token', '--global']):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'config')
-            self.assertEqual(args.config_command, 'get')
-            self.assertEqual(args.name, 'token')
-            self.assertEqual(args.scope, 'global')
+        args = parser.parse_args(CONFIG_GET_ARGV)
+        self.assertEqual(args.command, 'config')
+        self.assertEqual(args.config_command, 'get')
+        self.assertEqual(args.name, 'token')
+        self.assertEqual(args.scope, 'global')
         
         # Test with set subcommand
-        with patch('sys.argv', ['canvas', 'config', 'set', 'host', 'canvas.example.com', '--global']):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'config')
-            self.assertEqual(args.config_command, 'set')
-            self.assertEqual(args.name, 'host')
-            self.assertEqual(args.value, 'canvas.example.com')
-            self.assertEqual(args.scope, 'global')
+        args = parser.parse_args(CONFIG_SET_ARGV)
+        self.assertEqual(args.command, 'config')
+        self.assertEqual(args.config_command, 'set')
+        self.assertEqual(args.name, 'host')
+        self.assertEqual(args.value, 'canvas.example.com')
+        self.assertEqual(args.scope, 'global')
     
     def test_init_parser(self):
         """Test the init command parser"""
-        # Create parser
-        parser = create_parser()
+        # Use the shared parser
+        parser = self.parser
         
         # Test with all arguments
-        with patch('sys.argv', [
-            'canvas', 'init', 
-            '-cid', '12345', 
-            '-aid', '67890',
-            '-cn', 'Test Course',
-            '-an', 'Test Assignment',
-            '-f', 'test.py',
-            '-t'
-        ]):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'init')
-            self.assertEqual(args.course_id, '12345')
-            self.assertEqual(args.assignment_id, '67890')
-            self.assertEqual(args.course_name, 'Test Course')
-            self.assertEqual(args.assignment_name, 'Test Assignment')
-            self.assertEqual(args.file, 'test.py')
-            self.assertTrue(args.tui)
+        args = parser.parse_args(INIT_ALL_ARGV)
+        self.assertEqual(args.command, 'init')
+        self.assertEqual(args.course_id, '12345')
+        self.assertEqual(args.assignment_id, '67890')
+        self.assertEqual(args.course_name, 'Test Course')
+        self.assertEqual(args.assignment_name, 'Test Assignment')
+        self.assertEqual(args.file, 'test.py')
+        self.assertTrue(args.tui)
     
     def test_push_parser(self):
         """Test the push command parser"""
-        # Create parser
-        parser = create_parser()
+        # Use the shared parser
+        parser = self.parser
         
         # Test with all arguments
-        with patch('sys.argv', [
-            'canvas', 'push',
-            '-cid', '12345',
-            '-aid', '67890',
-            '-f', 'test.py'
-        ]):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'push')
-            self.assertEqual(args.course_id, 12345)
-            self.assertEqual(args.assignment_id, 67890)
-            self.assertEqual(args.file, 'test.py')
+        args = parser.parse_args(PUSH_ALL_ARGV)
+        self.assertEqual(args.command, 'push')
+        self.assertEqual(args.course_id, 12345)
+        self.assertEqual(args.assignment_id, 67890)
+        self.assertEqual(args.file, 'test.py')
     
-    # def test_pull_parser(self):
-    #     """Test the pull command parser"""
-    #     # Create parser
-    #     parser = create_parser()
-        
-    #     # Test with basic arguments
-    #     with patch('sys.argv', [
-    #         'canvas', 'pull',
-    #         '-cid', '12345',
-    #         '-aid', '67890'
-    #     ]):
-    #         args = parser.parse_args()
-    #         self.assertEqual(args.command, 'pull')
-    #         self.assertEqual(args.course_id, 12345)
-    #         self.assertEqual(args.assignment_id, 67890)
-    #         self.assertEqual(args.output, 'README.md')  # Default value
-        
-    #     # Test with all arguments
-    #     with patch('sys.argv', [
-    #         'canvas', 'pull',
-    #         '-cid', '12345',
-    #         '-aid', '67890',
-    #         '-o', 'custom.md',
-    #         '-od', './downloads',
-    #         '-f',
-    #         '-html',
-    #         '-pdf',
-    #         '-cdl',
-    #         '-dla'
-    #     ]):
-    #         args = parser.parse_args()
-    #         self.assertEqual(args.output, 'custom.md')
-    #         self.assertEqual(args.output_directory, './downloads')
-    #         self.assertTrue(args.force)
-    #         self.assertTrue(args.html)
-    #         self.assertTrue(args.pdf)
-    #         self.assertTrue(args.convert_links)
-    #         self.assertTrue(args.download_all)
+    def test_pull_parser(self):
+        """Test the pull command parser"""
+        for argv, expected in PULL_PARSER_CASES:
+            with self.subTest(argv=argv):
+                args = self.parser.parse_args(argv)
+                actual = {name: getattr(args, name) for name in expected}
+                self.assertEqual(actual, expected)
+    
+    def test_pull_parser_defaults(self):
+        """Test the pull command parser defaults"""
+        actual = {name: getattr(self.pull_defaults, name) for name in PULL_DEFAULTS}
+        self.assertEqual(actual, PULL_DEFAULTS)
     
     def test_status_parser(self):
         """Test the status command parser"""
-        # Create parser
-        parser = create_parser()
+        # Use the shared parser
+        parser = self.parser
         
         # Test with basic arguments
-        with patch('sys.argv', [
-            'canvas', 'status',
-            '-cid', '12345',
-            '-aid', '67890'
-        ]):
-            args = parser.parse_args()
-            self.assertEqual(args.command, 'status')
-            self.assertEqual(args.course_id, 12345)
-            self.assertEqual(args.assignment_id, 67890)
+        args = parser.parse_args(STATUS_BASIC_ARGV)
+        self.assertEqual(args.command, 'status')
+        self.assertEqual(args.course_id, 12345)
+        self.assertEqual(args.assignment_id, 67890)
         
         # Test with global view
-        with patch('sys.argv', ['canvas', 'status', 'all']):
-            args = parser.parse_args()
-            self.assertEqual(args.global_view, 'all')
+        args = parser.parse_args(STATUS_GLOBAL_ARGV)
+        self.assertEqual(args.global_view, 'all')
     
     def test_parse_args_and_dispatch(self):
         """Test parsing arguments and dispatching to handler functions"""
         # Create mock handler functions
         mock_handlers = {
-            'config': MagicMock(),
-            'init': MagicMock(),
-            'push': MagicMock(),
-            'status': MagicMock()
+            'config': Mock(),
+            'init': Mock(),
+            'push': Mock(),
+            'status': Mock()
         }
         
-        # Test with config command
-        with patch('sys.argv', ['canvas', 'config', 'list']):
-            parse_args_and_dispatch(mock_handlers)
-            mock_handlers['config'].assert_called_once()
-            mock_handlers['init'].assert_not_called()
-        
-        # Reset mocks
-        for mock in mock_handlers.values():
-            mock.reset_mock()
-        
-        # Test with init command
-        with patch('sys.argv', ['canvas', 'init']):
-            parse_args_and_dispatch(mock_handlers)
-            mock_handlers['config'].assert_not_called()
-            mock_handlers['init'].assert_called_once()
+        # Each command line should reach only its own handler
+        for argv in DISPATCH_ARGVS:
+            with self.subTest(command=argv[0]):
+                for mock in mock_handlers.values():
+                    mock.reset_mock()
+                
+                parse_args_and_dispatch(mock_handlers, argv)
+                for command, mock in mock_handlers.items():
+                    if command == argv[0]:
+                        mock.assert_called_once()
+                    else:
+                        mock.assert_not_called()
 
 if __name__ == "__main__":
     import unittest
@@ -4,8 +4,13 @@ Provides common utilities and mock data for testing
 """
 
 import unittest
+import copy
+import io
 import json
 import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -16,6 +21,9 @@ TEST_DATA_DIR = Path(__file__).parent / "mock_data"
 TEST_TOKEN="mock_token_12345"
 TEST_HOST="test.mockcanvas.edu"
 
+# Parsed mock data files, shared across all tests in the session
+_mock_data_cache = {}
+
 class CanvasCliTestCase(unittest.TestCase):
     """Base test case for Canvas CLI tests"""
 
@@ -31,6 +39,15 @@ class CanvasCliTestCase(unittest.TestCase):
             "token": TEST_TOKEN,
             "host": TEST_HOST
         }
+
+        # Isolate the global config so tests never touch the real $HOME config
+        self.config_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.config_dir, ignore_errors=True)
+        isolated_config = self.config_dir / "config.json"
+        isolated_config.write_text(json.dumps(self.mock_config))
+        config_path_patcher = patch("canvas_cli.config.USER_CONFIG_PATH", isolated_config)
+        config_path_patcher.start()
+        self.addCleanup(config_path_patcher.stop)
         
         # Mock API responses
         self.mock_courses = self._load_mock_data("courses.json", [
@@ -83,20 +100,33 @@ class CanvasCliTestCase(unittest.TestCase):
             "course_code": "TEST101",
         })
 
+    def _start_patch(self, target, attribute, **kwargs):
+        """Start a patcher that is stopped automatically after the test"""
+        patcher = patch.object(target, attribute, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+    
+    def _capture_stdout(self):
+        """Capture printed output for the rest of the test"""
+        return self._start_patch(sys, "stdout", new_callable=io.StringIO)
+    
     def _load_mock_data(self, filename, default_data):
         """Load mock data from file or create it if it doesn't exist"""
-        file_path = TEST_DATA_DIR / filename
-        if file_path.exists():
-            with open(file_path, "r") as f:
-                return json.load(f)
-        else:
-            # Create mock data file with provided defaults
-            # Note: For more realistic data, run record_api_responses.py script
-            print(f"Warning: Using default mock data for {filename}.")
-            print(f"For more realistic data, run 'python test/record_api_responses.py'")
-            with open(file_path, "w") as f:
-                json.dump(default_data, f, indent=2)
-            return default_data
+        # Each file is read once per session; tests get their own copy to mutate
+        if filename not in _mock_data_cache:
+            file_path = TEST_DATA_DIR / filename
+            if file_path.exists():
+                with open(file_path, "r") as f:
+                    _mock_data_cache[filename] = json.load(f)
+            else:
+                # Create mock data file with provided defaults
+                # Note: For more realistic data, run record_api_responses.py script
+                print(f"Warning: Using default mock data for {filename}.")
+                print(f"For more realistic data, run 'python test/record_api_responses.py'")
+                with open(file_path, "w") as f:
+                    json.dump(default_data, f, indent=2)
+                _mock_data_cache[filename] = default_data
+        return copy.deepcopy(_mock_data_cache[filename])
     
     def _mock_api_response(self, status_code=200, json_data=None):
         """Create a mock requests.Response object"""
@@ -0,0 +1,186 @@
+"""
+Tests for the CLI pull command
+"""
+
+import copy
+import shutil
+import tempfile
+import os
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+from test_base import CanvasCliTestCase
+from canvas_cli import cli
+from canvas_cli.cli import pull_command, main
+
+# Shared pull payloads, deep-copied per test since pull_command labels submissions in place
+PULL_ATTACHMENTS = [
+    {"url": "http://file.url/1", "filename": "file1.txt", "display_name": "file1.txt"},
+    {"url": "http://file.url/2", "filename": "file2.txt", "display_name": "file2.txt"}
+]
+
+SINGLE_SUBMISSION_RESPONSE = {
+    "submission_history": [{"attachments": PULL_ATTACHMENTS}],
+    "assignment": {"points_possible": "100"}
+}
+
+MULTIPLE_SUBMISSIONS_RESPONSE = {
+    "submission_history": [
+        {"attachments": PULL_ATTACHMENTS[:1], "submitted_at": "2024-01-01T00:00:00Z", "submission_type": "online_upload", "score": "90"},
+        {"attachments": PULL_ATTACHMENTS[1:], "submitted_at": "2024-01-02T00:00:00Z", "submission_type": "online_upload", "score": "100"}
+    ],
+    "assignment": {"points_possible": "100"}
+}
+
+# Submissions responses served by assignment id for pull runs through main()
+SUBMISSIONS_BY_ASSIGNMENT = {
+    456: None,
+    457: {"submission_history": []},
+    458: SINGLE_SUBMISSION_RESPONSE,
+    459: MULTIPLE_SUBMISSIONS_RESPONSE
+}
+
+# (command line, expected output) for pull runs through main()
+PULL_MAIN_CASES = (
+    (('pull', '-cid', '123', '-aid', '456'), "No submissions found for assignment 456 in course 123."),
+    (('pull', '-cid', '123', '-aid', '457'), "No submissions found for assignment 457 in course 123."),
+    (('pull', '-cid', '123', '-aid', '458', '-dl'), "Downloaded 2 attachments"),
+    (('pull', '-cid', '123', '-aid', '459'), "No submission selected."),
+)
+
+def get_submissions_by_assignment(course_id, assignment_id):
+    """Serve a fresh copy of the canned response, since pull_command labels submissions in place"""
+    return copy.deepcopy(SUBMISSIONS_BY_ASSIGNMENT[assignment_id])
+
+class PullCommandTests(CanvasCliTestCase):
+    """Tests for the pull command with its API, download, and selection collaborators patched"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        super().setUp()
+        
+        # Create a temporary directory for test files
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        
+        # Capture printed output
+        self.mock_stdout = self._capture_stdout()
+        
+        # Patch the collaborators every pull test replaces
+        self.mock_api_class = self._start_patch(cli, 'CanvasAPI')
+        self.mock_api = self.mock_api_class.return_value
+        self.mock_download_file = self._start_patch(cli, 'download_file')
+        self.mock_select_from_options = self._start_patch(cli, 'select_from_options')
+        self.mock_path = self._start_patch(cli, 'Path')
+        
+    def _pull_args(self, **overrides):
+        """Create an args namespace for the pull command"""
+        args = Namespace(
+            course_id=123,
+            assignment_id=456,
+            download_latest=True,
+            output_directory="output",
+            overwrite_file=True,
+            tui=False,
+            download_tui=False,
+            fallback_tui=False,
+        )
+        for name, value in overrides.items():
+            setattr(args, name, value)
+        return args
+        
+    def test_pull_command_single_submission(self):
+        """Test pull command downloads every attachment of a lone submission, with or without --download-latest"""
+        self.mock_path.cwd.return_value.joinpath.return_value.resolve.return_value = "/abs/output"
+        expected_calls = {
+            (a["url"], os.path.join("/abs/output", a["filename"]))
+            for a in PULL_ATTACHMENTS
+        }
+        
+        for download_latest in (True, False):
+            with self.subTest(download_latest=download_latest):
+                self.mock_download_file.reset_mock()
+                self.mock_api.get_submissions.return_value = copy.deepcopy(SINGLE_SUBMISSION_RESPONSE)
+                
+                pull_command(self._pull_args(download_latest=download_latest))
+                
+                # Verify no selection was made since there's only one submission
+                self.mock_select_from_options.assert_not_called()
+                # Compare only the first two arguments of each call
+                actual_calls = {call.args[:2] for call in self.mock_download_file.call_args_list}
+                self.assertEqual(actual_calls, expected_calls)
+                for download in self.mock_download_file.call_args_list:
+                    self.assertEqual(download.kwargs, {"overwrite": True})
+
+    def test_pull_command_select_submission(self):
+        # Setup args
+        args = self._pull_args(download_latest=False, overwrite_file=False)
+
+        # Setup mocks
+        submissions_resp = copy.deepcopy(MULTIPLE_SUBMISSIONS_RESPONSE)
+        self.mock_api.get_submissions.return_value = submissions_resp
+        self.mock_path.cwd.return_value.joinpath.return_value.resolve.return_value = "/abs/output"
+        self.mock_select_from_options.return_value = submissions_resp["submission_history"][1]
+
+        # Call function
+        pull_command(args)
+
+        # Assert download_file called for the selected submission's attachment
+        self.mock_download_file.assert_called_once_with(
+            "http://file.url/2", os.path.join("/abs/output", "file2.txt"), overwrite=False
+        )
+
+    def test_pull_command_no_submissions(self):
+        """Test pull command when there is no response or an empty submission history"""
+        for submissions_resp in (None, {"submission_history": []}):
+            with self.subTest(submissions_resp=submissions_resp):
+                self.mock_stdout.seek(0)
+                self.mock_stdout.truncate()
+                self.mock_api.get_submissions.return_value = submissions_resp
+
+                pull_command(self._pull_args())
+                output = self.mock_stdout.getvalue()
+                self.assertIn("No submissions found for assignment", output)
+                self.mock_download_file.assert_not_called()
+        
+    def test_pull_command_missing_args(self):
+        args = self._pull_args(course_id=None, assignment_id=None)
+
+        # Ensure get_submissions returns None, not a MagicMock
+        self.mock_api.get_submissions.return_value = None
+
+        # Patch Path.cwd to a temp directory to avoid accessing the real cwd
+        with patch.object(Path, 'cwd', return_value=Path(self.temp_dir)):
+            pull_command(args)
+        output = self.mock_stdout.getvalue()
+        self.assertIn("Please provide all requirements", output)
+
+    def test_pull_command_api_error(self):
+        args = self._pull_args()
+
+        self.mock_api_class.side_effect = ValueError("API error")
+
+        pull_command(args)
+        output = self.mock_stdout.getvalue()
+        self.assertIn("Error: API error", output)
+
+    def test_main_pull(self):
+        """Test pull command lines dispatched through main with shared patches"""
+        # Configure the mocks once for every command line
+        self.mock_api.get_submissions.side_effect = get_submissions_by_assignment
+        # Cancel the selection prompt for the multiple submissions case
+        self.mock_select_from_options.return_value = None
+        
+        for argv, expected_message in PULL_MAIN_CASES:
+            with self.subTest(argv=argv):
+                # Reset captured output between command lines
+                self.mock_stdout.seek(0)
+                self.mock_stdout.truncate()
+                
+                main(argv)
+                self.assertIn(expected_message, self.mock_stdout.getvalue())
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
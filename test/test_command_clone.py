@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from types import SimpleNamespace
+from unittest.mock import patch, mock_open
 from io import BytesIO
 import sys
 import os
@@ -36,10 +37,8 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test basic markdown conversion functionality"""
         # Setup mock
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         
@@ -65,10 +64,8 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test markdown conversion with content integration"""
         # Setup mock
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         
@@ -88,12 +85,9 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test markdown conversion with PDF files"""
         # Setup mocks
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
-        mock_result_pdf = MagicMock()
-        mock_result_pdf.text_content = "This is PDF content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
+        mock_result_pdf = SimpleNamespace(text_content="This is PDF content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         mock_markitdown.convert.return_value = mock_result_pdf
@@ -112,12 +106,9 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test markdown conversion with DOCX files"""
         # Setup mocks
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
-        mock_result_doc = MagicMock()
-        mock_result_doc.text_content = "This is DOCX content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
+        mock_result_doc = SimpleNamespace(text_content="This is DOCX content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         mock_markitdown.convert.return_value = mock_result_doc
@@ -134,14 +125,10 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test markdown conversion with PDF and DOCX files"""
         # Setup mocks
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
-        mock_result_pdf = MagicMock()
-        mock_result_pdf.text_content = "This is PDF content"
-        mock_result_doc = MagicMock()
-        mock_result_doc.text_content = "This is DOCX content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
+        mock_result_pdf = SimpleNamespace(text_content="This is PDF content")
+        mock_result_doc = SimpleNamespace(text_content="This is DOCX content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         mock_markitdown.convert.side_effect = [mock_result_pdf, mock_result_doc]
@@ -170,10 +157,8 @@ class ConvertToMarkdownTests(unittest.TestCase):
         """Test that non-matching file types are skipped"""
         # Setup mocks
         mock_markitdown = mock_markitdown_class.return_value
-        mock_result_description = MagicMock()
-        mock_result_description.text_content = "This is a test description"
-        mock_result_page = MagicMock()
-        mock_result_page.text_content = "This is page 1 content"
+        mock_result_description = SimpleNamespace(text_content="This is a test description")
+        mock_result_page = SimpleNamespace(text_content="This is page 1 content")
         
         mock_markitdown.convert_stream.side_effect = [mock_result_description, mock_result_page]
         
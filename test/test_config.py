@@ -2,12 +2,12 @@
 Tests for the config module
 """
 
-import os
 import json
-import tempfile
-import shutil
+import os
+import stat
+import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from test_base import CanvasCliTestCase
 from canvas_cli.config import Config
@@ -19,23 +19,10 @@ class ConfigTests(CanvasCliTestCase):
         """Set up test environment"""
         super().setUp()
         
-        # Create temporary directory for test configs
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_global_config = Path(self.temp_dir) / "config.json"
-        self.temp_project_config = Path(self.temp_dir) / "canvas.json"
-        
-        # Save mock config to temporary file
-        with open(self.temp_global_config, "w") as f:
-            json.dump(self.mock_config, f)
-        
-        # Patch the USER_CONFIG_PATH to use our temp file
-        self.global_path_patcher = patch("canvas_cli.config.USER_CONFIG_PATH", self.temp_global_config)
-        self.mock_global_path = self.global_path_patcher.start()
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        self.global_path_patcher.stop()
-        shutil.rmtree(self.temp_dir)
+        # The base class already points USER_CONFIG_PATH at config.json in config_dir
+        self.temp_dir = self.config_dir
+        self.temp_global_config = self.config_dir / "config.json"
+        self.temp_project_config = self.config_dir / "canvas.json"
     
     def test_load_global_config(self):
         """Test loading global configuration"""
@@ -67,6 +54,18 @@ class ConfigTests(CanvasCliTestCase):
         value = Config.get_value("test_key", "global")
         self.assertEqual(value, "test_value")
     
+    @patch("canvas_cli.config.Path.cwd")
+    def test_set_get_value_local(self, mock_cwd):
+        """Test setting and getting values in the local project config"""
+        mock_cwd.return_value = Path(self.temp_dir)
+
+        # Set a new value through the local write path
+        Config.set_value("test_key", "test_value", "local")
+
+        # Verify it was written to canvas.json and reads back
+        self.assertEqual(Config.get_value("test_key", "local"), "test_value")
+        self.assertEqual(json.loads(self.temp_project_config.read_text())["test_key"], "test_value")
+    
     def test_unset_value_global(self):
         """Test unsetting values from global config"""
         # Set then unset a value
@@ -90,8 +89,7 @@ class ConfigTests(CanvasCliTestCase):
         """Test loading project configuration"""
         # Create a project config in our temp directory
         project_config = {"course_id": "12345", "assignment_id": "67890", "default_upload": "test.py"}
-        with open(self.temp_project_config, "w") as f:
-            json.dump(project_config, f)
+        self.temp_project_config.write_text(json.dumps(project_config))
         
         # Mock the current working directory to our temp dir
         mock_cwd.return_value = Path(self.temp_dir)
@@ -114,25 +112,93 @@ class ConfigTests(CanvasCliTestCase):
         Config.save_project_config(project_config)
         
         # Verify file was created with correct content
-        with open(self.temp_project_config, "r") as f:
-            saved_config = json.load(f)
+        saved_config = json.loads(self.temp_project_config.read_text())
         
         self.assertEqual(saved_config["course_id"], project_config["course_id"])
         self.assertEqual(saved_config["assignment_id"], project_config["assignment_id"])
 
-    def test_get_values_returns_first_non_none(self):
+    def test_save_global_config_leaves_no_temp_file(self):
+        """Test saving global configuration replaces the file atomically"""
+        Config.save_global(self.mock_config)
+
+        # Only the final config file should remain
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [self.temp_global_config])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_save_global_config_keeps_permissions(self):
+        """Test saving global configuration keeps a private file private"""
+        self.temp_global_config.chmod(0o600)
+
+        Config.save_global(self.mock_config)
+
+        self.assertEqual(stat.S_IMODE(self.temp_global_config.stat().st_mode), 0o600)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    @patch("canvas_cli.config.Path.cwd")
+    def test_save_project_config_respects_umask(self, mock_cwd):
+        """Test a new project config gets the mode allowed by the umask"""
+        mock_cwd.return_value = Path(self.temp_dir)
+        old_umask = os.umask(0o077)
+        self.addCleanup(os.umask, old_umask)
+
+        Config.save_project_config({"token": "secret"})
+
+        self.assertEqual(stat.S_IMODE(self.temp_project_config.stat().st_mode), 0o600)
+
+    def test_save_global_config_through_symlink(self):
+        """Test saving global configuration updates the target of a symlinked file"""
+        # Point the configured path at the real file through a symlink
+        link = Path(self.temp_dir) / "linked.json"
+        try:
+            link.symlink_to(self.temp_global_config)
+        except OSError:
+            self.skipTest("symlinks not supported")
+
+        with patch("canvas_cli.config.USER_CONFIG_PATH", link):
+            Config.save_global({**self.mock_config, "new_key": "new_value"})
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(json.loads(self.temp_global_config.read_text())["new_key"], "new_value")
+
+    def test_save_global_config_failure_removes_temp_file(self):
+        """Test a failed save leaves the original file and no temp file behind"""
+        original = self.temp_global_config.read_text()
+
+        with patch("canvas_cli.config.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                Config.save_global({"token": "other"})
+
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [self.temp_global_config])
+        self.assertEqual(self.temp_global_config.read_text(), original)
+
+    def _seed_configs(self):
+        """Write a global and a local config sharing the key 'multi_key'"""
+        global_config = {**self.mock_config, "multi_key": "global_val"}
+        local_config = {"course_id": "12345", "multi_key": "local_val"}
+        self.temp_global_config.write_text(json.dumps(global_config))
+        self.temp_project_config.write_text(json.dumps(local_config))
+        return global_config, local_config
+
+    @patch("canvas_cli.config.Path.cwd")
+    def test_get_values_returns_first_non_none(self, mock_cwd):
         """Test get_values returns first non-None value from scopes"""
-        Config.set_value("multi_key", "global_val", "global")
-        with patch("canvas_cli.config.Path.cwd") as mock_cwd:
-            mock_cwd.return_value = Path(self.temp_dir)
-            Config.set_value("multi_key", "local_val", "local")
-            # Should return local first
-            val = Config.get_value("multi_key", ["local", "global"])
-            self.assertEqual(val, "local_val")
-            # Remove local, should return global
-            Config.unset_value("multi_key", "local")
-            val2 = Config.get_value("multi_key", ["local", "global"])
-            self.assertEqual(val2, "global_val")
+        mock_cwd.return_value = Path(self.temp_dir)
+        _, local_config = self._seed_configs()
+
+        # Should return local first
+        val = Config.get_value("multi_key", ["local", "global"])
+        self.assertEqual(val, local_config["multi_key"])
+
+    @patch("canvas_cli.config.Path.cwd")
+    def test_get_values_falls_back_to_global(self, mock_cwd):
+        """Test get_values falls back to the next scope once local is unset"""
+        mock_cwd.return_value = Path(self.temp_dir)
+        global_config, _ = self._seed_configs()
+
+        # Remove local, should return global
+        Config.unset_value("multi_key", "local")
+        val = Config.get_value("multi_key", ["local", "global"])
+        self.assertEqual(val, global_config["multi_key"])
 
     def test_get_values_returns_none_if_not_found(self):
         """Test get_values returns None if key not found in any scope"""
@@ -140,5 +206,4 @@ class ConfigTests(CanvasCliTestCase):
         self.assertIsNone(val)
         
 if __name__ == "__main__":
-    import unittest
     unittest.main()
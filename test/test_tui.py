@@ -2,13 +2,48 @@
 Tests for the TUI module
 """
 
-from pathlib import Path
-from random import randint
-import sys
-from unittest.mock import ANY, patch, MagicMock, call
+import builtins
+import unittest
+from unittest.mock import ANY, DEFAULT, patch, MagicMock, call
 
 from test_base import CanvasCliTestCase
-from canvas_cli.tui import run_tui, select_file, select_from_options
+from canvas_cli.tui import CURSES_AVAILABLE, run_tui, select_from_list, select_from_options, text_select_course_and_assignment
+
+# Items shared by the selection tests; none of them mutate the dicts
+SAMPLE_ITEMS = (
+    {"id": 1, "name": "Introduction to Testing", "course_code": "TEST101"},
+    {"id": 2, "name": "Advanced Python Testing", "course_code": "PY302"},
+    {"id": 3, "name": "Programming with Python", "course_code": "CS220"}
+)
+
+# (case id, typed answers, index of the expected item or None) for select_from_list
+SELECT_FROM_LIST_CASES = (
+    ("first", ('1',), 0),
+    ("last", ('3',), 2),
+    ("quit", ('q',), None),
+    ("not_a_number", ('abc', '2'), 1),
+    ("out_of_range", ('99', '1'), 0),
+    ("empty_search", ('/', '1'), 0),
+    ("search_no_matches", ('/nonexistent', '2'), 1),
+    ("search_match", ('/python', '1'), 1),
+)
+
+KEY_RETURN = 10
+KEY_ESCAPE = 27
+
+# Key codes looked up once; SelectionList only exists when curses is available
+if CURSES_AVAILABLE:
+    import curses
+    from canvas_cli.tui import SelectionList
+    KEY_UP = curses.KEY_UP
+    KEY_DOWN = curses.KEY_DOWN
+    KEY_BACKSPACE = curses.KEY_BACKSPACE
+    
+    # getch key sequences for the select_from_options curses tests
+    SEQ_RETURN = (KEY_RETURN,)
+    SEQ_DOWN_DOWN_UP_RETURN = (KEY_DOWN, KEY_DOWN, KEY_UP, KEY_RETURN)
+    SEQ_DOWN_PAST_END_RETURN = (KEY_DOWN, KEY_DOWN, KEY_DOWN, KEY_DOWN, KEY_RETURN)
+    SEQ_DOWN_ESCAPE = (KEY_DOWN, KEY_ESCAPE)
 
 class TUITests(CanvasCliTestCase):
     """Tests for the TUI module"""
@@ -36,6 +71,10 @@ class TUITests(CanvasCliTestCase):
         self.wrapper_patcher = patch('canvas_cli.tui.curses.wrapper')
         self.mock_wrapper = self.wrapper_patcher.start()
         self.mock_wrapper.return_value = (self.mock_courses[0], self.mock_assignments[0])
+        
+        # Answer input() prompts from a queue each test fills as needed
+        self.inputs = []
+        self._start_patch(builtins, 'input', new=lambda prompt='': self.inputs.pop(0))
     
     def tearDown(self):
         """Clean up after tests"""
@@ -90,8 +129,8 @@ class TUITests(CanvasCliTestCase):
         """Test running the TUI when curses is not available"""
         # Mock curses as not available
         self.mock_curses_available = False
-        with patch('canvas_cli.tui.CURSES_AVAILABLE', False), \
-             patch('canvas_cli.tui.text_select_course_and_assignment') as mock_text_select:
+        with patch.multiple('canvas_cli.tui', CURSES_AVAILABLE=False, text_select_course_and_assignment=DEFAULT) as mocks:
+            mock_text_select = mocks['text_select_course_and_assignment']
             mock_text_select.return_value = (self.mock_courses[0], self.mock_assignments[0])
             
             # Run TUI
@@ -106,17 +145,33 @@ class TUITests(CanvasCliTestCase):
     
     def test_text_select_course_and_assignment(self):
         """Test the text-based selection interface"""
-        # Mock the input function to simulate user selections
-        with patch('builtins.input', side_effect=['1', '1']), \
-             patch('canvas_cli.tui.text_select_course_and_assignment') as mock_text_select:
-            mock_text_select.return_value = (self.mock_courses[0], self.mock_assignments[0])
-            
-            # Run TUI with fallback
-            course_id, assignment_id, course_name, assignment_name = run_tui(fallback=True)
-            
-            # Verify correct selections
-            self.assertEqual(course_id, self.mock_courses[0]['id'])
-            self.assertEqual(assignment_id, self.mock_assignments[0]['id'])
+        # Select the first course, then its first assignment
+        self.inputs.extend(('1', '1'))
+        self._capture_stdout()
+        
+        course, assignment = text_select_course_and_assignment()
+        
+        # Verify correct selections and that every answer was read
+        self.assertEqual(course, self.mock_courses[0])
+        self.assertEqual(assignment, self.mock_assignments[0])
+        self.assertEqual(self.inputs, [])
+    
+    def test_select_from_list(self):
+        """Test numeric, search, quit, and invalid answers in the text selection list"""
+        items = list(SAMPLE_ITEMS)
+        mock_stdout = self._capture_stdout()
+        for case, inputs, expected_index in SELECT_FROM_LIST_CASES:
+            with self.subTest(case=case):
+                self.inputs[:] = inputs
+                mock_stdout.seek(0)
+                mock_stdout.truncate()
+                
+                result = select_from_list(items, lambda item, _: item["name"], "Test List")
+                
+                expected = None if expected_index is None else items[expected_index]
+                self.assertEqual(result, expected)
+                self.assertEqual(self.inputs, [])
+                self.assertIn("--- Test List", mock_stdout.getvalue())
     
     def test_run_tui_cancelled(self):
         """Test running the TUI when selection is cancelled"""
@@ -142,7 +197,8 @@ class TUITests(CanvasCliTestCase):
             course_id, assignment_id, course_name, assignment_name = run_tui()
             
             # Verify error was printed
-            mock_print.assert_any_call("An error occurred: Test error")
+            expected = call("An error occurred: Test error")
+            self.assertIn(expected, mock_print.call_args_list)
         
         # Verify all returned values are None
         self.assertIsNone(course_id)
@@ -169,8 +225,8 @@ class TUITests(CanvasCliTestCase):
     def test_select_from_options_text_fallback(self):
         """Test select_from_options with fallback to text interface"""
         # Patch CURSES_AVAILABLE to False and patch select_from_list
-        with patch('canvas_cli.tui.CURSES_AVAILABLE', False), \
-                patch('canvas_cli.tui.select_from_list') as mock_select_from_list:
+        with patch.multiple('canvas_cli.tui', CURSES_AVAILABLE=False, select_from_list=DEFAULT) as mocks:
+            mock_select_from_list = mocks['select_from_list']
             options = [
                 {'id': 1, 'label': 'Option 1'},
                 {'id': 2, 'label': 'Option 2'},
@@ -185,7 +241,8 @@ class TUITests(CanvasCliTestCase):
         with patch('builtins.print') as mock_print:
             result = select_from_options([], label_key='label', title="Empty Options")
             self.assertIsNone(result)
-            mock_print.assert_any_call("No options available.")
+            expected = call("No options available.")
+            self.assertIn(expected, mock_print.call_args_list)
 
     def test_select_from_options_exception(self):
         """Test select_from_options handles exceptions gracefully"""
@@ -196,8 +253,113 @@ class TUITests(CanvasCliTestCase):
             options = [{'id': 1, 'label': 'Option 1'}]
             result = select_from_options(options, label_key='label', title="Test Options")
             self.assertIsNone(result)
-            mock_print.assert_any_call("Error during selection: Boom")
+            expected = call("Error during selection: Boom")
+            self.assertIn(expected, mock_print.call_args_list)
+            
+@unittest.skipUnless(CURSES_AVAILABLE, "curses is not available")
+class SelectionListTests(unittest.TestCase):
+    """Tests for the curses SelectionList key handling"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.items = list(SAMPLE_ITEMS)
+        self.selection_list = SelectionList(self.items, "Test List")
+    
+    def test_navigation_and_select(self):
+        """Test moving the selection with arrow keys and selecting with Enter"""
+        # Move down twice, then past the end of the list
+        self.assertIsNone(self.selection_list.handle_key(KEY_DOWN))
+        self.selection_list.handle_key(KEY_DOWN)
+        self.selection_list.handle_key(KEY_DOWN)
+        self.assertEqual(self.selection_list.selected_idx, 2)
+        
+        # Move back up and select
+        self.selection_list.handle_key(KEY_UP)
+        self.assertEqual(self.selection_list.handle_key(KEY_RETURN), self.items[1])
+    
+    def test_search_and_backspace(self):
+        """Test typing filters the list and backspace clears the search"""
+        # Typing a printable character starts a search
+        for key in b"python":
+            self.selection_list.handle_key(key)
+        self.assertTrue(self.selection_list.search_mode)
+        self.assertEqual(self.selection_list.search_text, "python")
+        self.assertEqual(len(self.selection_list.filtered_items), 2)
+        
+        # Backspace removes characters until every item is shown again
+        for _ in "python":
+            self.selection_list.handle_key(KEY_BACKSPACE)
+        self.assertEqual(self.selection_list.search_text, "")
+        self.assertEqual(len(self.selection_list.filtered_items), len(self.items))
+    
+    def test_select_with_no_matches(self):
+        """Test Enter returns nothing when the search matches no items"""
+        for key in b"zzz":
+            self.selection_list.handle_key(key)
+        self.assertEqual(self.selection_list.filtered_items, [])
+        self.assertIsNone(self.selection_list.handle_key(KEY_RETURN))
+
+@unittest.skipUnless(CURSES_AVAILABLE, "curses is not available")
+class SelectFromOptionsCursesTests(unittest.TestCase):
+    """Tests for select_from_options driven through a mocked curses screen"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the mocked screen once for the class"""
+        cls.mock_stdscr = MagicMock()
+        cls.mock_stdscr.getmaxyx.return_value = (24, 80)
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Clear recorded calls and keys from the previous test
+        self.mock_stdscr.reset_mock(side_effect=True)
+        self.mock_stdscr.getmaxyx.return_value = (24, 80)
+        
+        # Run the selection loop directly against the mocked screen
+        for target, kwargs in (
+            ('canvas_cli.tui.curses.wrapper', {'side_effect': lambda func: func(self.mock_stdscr)}),
+            ('canvas_cli.tui.curses.color_pair', {'return_value': 0}),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        # Hiding the cursor needs a real terminal
+        patcher = patch('canvas_cli.tui.curses.curs_set')
+        self.mock_curs_set = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.options = [
+            {'id': 1, 'label': 'Option 1'},
+            {'id': 2, 'label': 'Option 2'},
+            {'id': 3, 'label': 'Option 3'},
+        ]
+    
+    def test_select_first_option(self):
+        """Test Enter selects the highlighted first option"""
+        self.mock_stdscr.getch.side_effect = iter(SEQ_RETURN)
+        result = select_from_options(self.options, label_key='label')
+        self.assertEqual(result, self.options[0])
+        self.mock_curs_set.assert_called_once_with(0)
+    
+    def test_navigate_and_select(self):
+        """Test arrow keys move the highlight before selecting"""
+        self.mock_stdscr.getch.side_effect = iter(SEQ_DOWN_DOWN_UP_RETURN)
+        result = select_from_options(self.options, label_key='label')
+        self.assertEqual(result, self.options[1])
+    
+    def test_navigate_past_end(self):
+        """Test moving down past the last option keeps it selected"""
+        self.mock_stdscr.getch.side_effect = iter(SEQ_DOWN_PAST_END_RETURN)
+        result = select_from_options(self.options, label_key='label')
+        self.assertEqual(result, self.options[2])
+    
+    def test_escape_cancels(self):
+        """Test Esc cancels the selection"""
+        self.mock_stdscr.getch.side_effect = iter(SEQ_DOWN_ESCAPE)
+        result = select_from_options(self.options, label_key='label')
+        self.assertIsNone(result)
+        self.assertEqual(self.mock_stdscr.getch.call_count, len(SEQ_DOWN_ESCAPE))
             
 if __name__ == "__main__":
-    import unittest
     unittest.main()
@@ -2,58 +2,108 @@
 Tests for the TUI utils module
 """
 
-from unittest.mock import patch, MagicMock
-from datetime import datetime
+import copy
 
 from test_base import CanvasCliTestCase
 from canvas_cli.tui_utils import FuzzySearch, Formatter
 
+# Sample course and assignment items; the test class works on its own copy
+COURSE_ITEMS = [
+    {
+        "id": 12345,
+        "name": "Introduction to Testing",
+        "course_code": "TEST101",
+        "is_favorite": True
+    },
+    {
+        "id": 67890,
+        "name": "Advanced Python Testing",
+        "course_code": "PY302",
+        "is_favorite": False
+    },
+    {
+        "id": 54321,
+        "name": "Programming with Python",
+        "course_code": "CS220",
+        "is_favorite": False
+    }
+]
+
+ASSIGNMENT_ITEMS = [
+    {
+        "id": 11111,
+        "name": "Unit Test Assignment",
+        "due_at": "2023-12-31T23:59:59Z",
+        "has_submitted_submissions": False,
+        "submission_types": ["online_upload"]
+    },
+    {
+        "id": 22222,
+        "name": "Integration Test Project",
+        "due_at": "2023-11-15T23:59:59Z",
+        "has_submitted_submissions": True,
+        "locked_for_user": False,
+        "submission_types": ["online_upload"]
+    }
+]
+
+# Expected format_item output for the sample items; their due dates are in the past
+EXPECTED_FAVORITE_COURSE = f"{Formatter.ICON_FAVORITE}  Introduction to Testing (TEST101)"
+EXPECTED_COURSE = " Advanced Python Testing (PY302)"
+EXPECTED_PAST_DUE_ASSIGNMENT = f"{Formatter.ICON_PAST_DUE}  Unit Test Assignment (Due: 2023-12-31)"
+EXPECTED_SUBMITTED_ASSIGNMENT = (
+    f"{Formatter.ICON_SUBMITTED} {Formatter.ICON_PAST_DUE}  Integration Test Project (Due: 2023-11-15)"
+)
+
+# Fixed due dates far on either side of now
+PAST_ISO = "2000-01-01T00:00:00Z"
+FUTURE_ISO = "2099-01-01T00:00:00Z"
+
+# (case id, item, expected color pair) table for get_color
+GET_COLOR_CASES = (
+    ("locked", {
+        "locked_for_user": True,
+        "due_at": PAST_ISO,
+        "has_submitted_submissions": False
+    }, Formatter.COLORS_LOCKED),
+    ("completed", {
+        "locked_for_user": False,
+        "due_at": PAST_ISO,
+        "has_submitted_submissions": True
+    }, Formatter.COLORS_COMPLETED),
+    ("past_due", {
+        "locked_for_user": False,
+        "due_at": PAST_ISO,
+        "has_submitted_submissions": False
+    }, Formatter.COLORS_PAST_DUE),
+    ("submitted", {
+        "locked_for_user": False,
+        "due_at": FUTURE_ISO,
+        "has_submitted_submissions": True
+    }, Formatter.COLORS_SUBMITTED),
+    ("favorite", {
+        "locked_for_user": False,
+        "due_at": FUTURE_ISO,
+        "has_submitted_submissions": False,
+        "is_favorite": True
+    }, Formatter.COLORS_FAVORITE),
+    ("normal", {
+        "locked_for_user": False,
+        "due_at": FUTURE_ISO,
+        "has_submitted_submissions": False,
+        "is_favorite": False
+    }, Formatter.COLORS_NORMAL),
+)
+
 class TUIUtilsTests(CanvasCliTestCase):
     """Tests for the TUI utilities"""
     
-    def setUp(self):
-        """Set up test environment"""
-        super().setUp()
-        
-        # Sample test items
-        self.course_items = [
-            {
-                "id": 12345,
-                "name": "Introduction to Testing",
-                "course_code": "TEST101",
-                "is_favorite": True
-            },
-            {
-                "id": 67890,
-                "name": "Advanced Python Testing",
-                "course_code": "PY302",
-                "is_favorite": False
-            },
-            {
-                "id": 54321,
-                "name": "Programming with Python",
-                "course_code": "CS220",
-                "is_favorite": False
-            }
-        ]
-        
-        self.assignment_items = [
-            {
-                "id": 11111,
-                "name": "Unit Test Assignment",
-                "due_at": "2023-12-31T23:59:59Z",
-                "has_submitted_submissions": False,
-                "submission_types": ["online_upload"]
-            },
-            {
-                "id": 22222,
-                "name": "Integration Test Project",
-                "due_at": "2023-11-15T23:59:59Z",
-                "has_submitted_submissions": True,
-                "locked_for_user": False,
-                "submission_types": ["online_upload"]
-            }
-        ]
+    @classmethod
+    def setUpClass(cls):
+        """Copy the sample items once; these tests only read them"""
+        super().setUpClass()
+        cls.course_items = copy.deepcopy(COURSE_ITEMS)
+        cls.assignment_items = copy.deepcopy(ASSIGNMENT_ITEMS)
     
     def test_fuzzy_contains(self):
         """Test the fuzzy text matching algorithm"""
@@ -120,96 +170,28 @@ class TUIUtilsTests(CanvasCliTestCase):
     def test_format_item_course(self):
         """Test formatting a course item for display"""
         # Test formatting a favorite course
-        course = self.course_items[0]
-        formatted = Formatter.format_item(course, "courses")
-        self.assertIn(course["name"], formatted)
-        self.assertIn(course["course_code"], formatted)
-        self.assertIn(Formatter.ICON_FAVORITE, formatted)
+        formatted = Formatter.format_item(self.course_items[0], "courses")
+        self.assertEqual(formatted, EXPECTED_FAVORITE_COURSE)
         
         # Test formatting a non-favorite course
-        course = self.course_items[1]
-        formatted = Formatter.format_item(course, "courses")
-        self.assertIn(course["name"], formatted)
-        self.assertIn(course["course_code"], formatted)
-        self.assertNotIn(Formatter.ICON_FAVORITE, formatted)
+        formatted = Formatter.format_item(self.course_items[1], "courses")
+        self.assertEqual(formatted, EXPECTED_COURSE)
     
     def test_format_item_assignment(self):
         """Test formatting an assignment item for display"""
-        # Test formatting a non-submitted assignment
-        assignment = self.assignment_items[0]
-        formatted = Formatter.format_item(assignment, "assignments")
-        self.assertIn(assignment["name"], formatted)
-        self.assertIn("Due:", formatted)
-        self.assertNotIn(Formatter.ICON_SUBMITTED, formatted)
+        # Test formatting a past due, non-submitted assignment
+        formatted = Formatter.format_item(self.assignment_items[0], "assignments")
+        self.assertEqual(formatted, EXPECTED_PAST_DUE_ASSIGNMENT)
         
-        # Test formatting a submitted assignment
-        assignment = self.assignment_items[1]
-        formatted = Formatter.format_item(assignment, "assignments")
-        self.assertIn(assignment["name"], formatted)
-        self.assertIn("Due:", formatted)
-        self.assertIn(Formatter.ICON_SUBMITTED, formatted)
+        # Test formatting a past due, submitted assignment
+        formatted = Formatter.format_item(self.assignment_items[1], "assignments")
+        self.assertEqual(formatted, EXPECTED_SUBMITTED_ASSIGNMENT)
     
-    @patch('canvas_cli.tui_utils.curses')
-    def test_get_color(self, mock_curses):
+    def test_get_color(self):
         """Test getting the color for an item based on status"""
-        # Mock curses color pairs
-        mock_curses.color_pair.side_effect = lambda x: x
-        
-        # Test locked item
-        item = {
-            "locked_for_user": True,
-            "due_at": "2023-12-31T23:59:59Z",
-            "has_submitted_submissions": False
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_LOCKED)
-        
-        # Test past due and submitted
-        item = {
-            "locked_for_user": False,
-            "due_at": "2000-01-01T00:00:00Z",  # Past date
-            "has_submitted_submissions": True
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_COMPLETED)
-        
-        # Test past due and not submitted
-        item = {
-            "locked_for_user": False,
-            "due_at": "2000-01-01T00:00:00Z",  # Past date
-            "has_submitted_submissions": False
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_PAST_DUE)
-        
-        # Test not due and submitted
-        item = {
-            "locked_for_user": False,
-            "due_at": "2099-01-01T00:00:00Z",  # Future date
-            "has_submitted_submissions": True
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_SUBMITTED)
-        
-        # Test favorite
-        item = {
-            "locked_for_user": False,
-            "due_at": "2099-01-01T00:00:00Z",  # Future date
-            "has_submitted_submissions": False,
-            "is_favorite": True
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_FAVORITE)
-        
-        # Test normal item
-        item = {
-            "locked_for_user": False,
-            "due_at": "2099-01-01T00:00:00Z",  # Future date
-            "has_submitted_submissions": False,
-            "is_favorite": False
-        }
-        color = Formatter.get_color(item)
-        self.assertEqual(color, Formatter.COLORS_NORMAL)
+        for case, item, expected in GET_COLOR_CASES:
+            with self.subTest(case=case):
+                self.assertEqual(Formatter.get_color(item), expected)
 
 if __name__ == "__main__":
     import unittest